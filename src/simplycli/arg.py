@@ -1,4 +1,5 @@
 import inspect
+import re
 from typing import Union, Any, Callable
 from simplycli import cli
 
@@ -30,6 +31,10 @@ class CommandSignatureError(Exception):
         """
         super().__init__(message)
 
+
+_SEGMENT_DELIMITER = re.compile(r"\s")
+
+
 class SegmentString:
     def __init__(self, raw_input: str):
         self.segments = SegmentString._parse_segments(raw_input)
@@ -39,6 +44,13 @@ class SegmentString:
 
     @staticmethod
     def _parse_segments(raw_input: str):
+        # without quotes every whitespace character ends a segment, so the character loop can be skipped
+        if "'" not in raw_input and '"' not in raw_input:
+            segments = _SEGMENT_DELIMITER.split(raw_input)
+            if segments[-1] == "":
+                segments.pop()
+            return segments
+
         segments = []
         delimiters = []
         segment = ""
@@ -154,6 +166,12 @@ The parsing method used by :func:`ArgParser.parse`. This defaults to :func:`ArgP
 """
 
 
+_PARAM_SELF = "self"
+_PARAM_COMMAND = "command"
+_PARAM_ARG = "arg"
+_PARAM_DEFAULT = "default"
+
+
 class ArgMatcher:
     _empty_type_ = inspect._empty
 
@@ -172,6 +190,7 @@ class ArgMatcher:
 
         self.__vargs__ = False
         self.__validate_arguments__()
+        self.__plan__ = self.__build_plan__()
 
     def match_arguments(self, raw_input: str) -> list[Any]:
         """
@@ -183,8 +202,26 @@ class ArgMatcher:
 
         segments = SegmentString(raw_input)
 
-        ignore = 0
         arguments = []
+        for kind, value, expected_type in self.__plan__:
+            if kind is _PARAM_ARG:
+                arguments.append(value.parse(segments, expected_type))
+            elif kind is _PARAM_SELF:
+                arguments.append(self.command.get_instance())
+            elif kind is _PARAM_COMMAND:
+                arguments.append(self.command)
+            else:
+                arguments.append(value)
+
+        if self.__vargs__:
+            arguments.extend(segments.unmatched())
+
+        return arguments
+
+    def __build_plan__(self) -> tuple:
+        # resolves each parameter to how its value is produced, so that matching never re-inspects the signature
+        ignore = 0
+        plan = []
         for i in range(len(self.parameters)):
             parameter = self.parameters[i]
             default = parameter.default
@@ -203,26 +240,19 @@ class ArgMatcher:
             if parameter.name == "self":
                 ignore += 1
                 if self.command.is_class:
-                    arguments.append(self.command.get_instance())
+                    plan.append((_PARAM_SELF, None, None))
             elif expected_type is cli.Command:
                 ignore += 1
-                arguments.append(self.command)
+                plan.append((_PARAM_COMMAND, None, None))
             elif isinstance(default, Arg):  # special syntax where default value is Arg() class used as an 'annotation'
                 default.__fill_info__(parameter.name)
 
-                if default.expected_type:   # transform the input value into the arg's expected type
-                    value = default.parse(segments, default.expected_type)
-                else:                       # otherwise transform it into the parameter's annotated type
-                    value = default.parse(segments, expected_type)
-
-                arguments.append(value)
+                # transform the input value into the arg's expected type, otherwise the parameter's annotated type
+                plan.append((_PARAM_ARG, default, default.expected_type if default.expected_type else expected_type))
             elif default is not ArgMatcher._empty_type_:
-                arguments.append(default)
-
-        if self.__vargs__:
-            arguments.extend(segments.unmatched())
+                plan.append((_PARAM_DEFAULT, default, None))
 
-        return arguments
+        return tuple(plan)
 
     def __validate_arguments__(self):
         for i in range(len(self.parameters)):
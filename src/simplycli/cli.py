@@ -1,19 +1,66 @@
 import inspect
-import re
-from typing import Union, Callable, Any
+import sys
+from typing import Union, Callable, Any, Iterable, Optional
 from .arg import ArgMatcher, Arg
 from .bundle import BundleManager
 from .decorators import __complex_decorator__
 from .meta import CommandLike, AbstractFunctionCommandWrapper
 
+RESULT_CACHE_SIZE = 128
+"""
+The maximum number of results kept per command registered with `cacheable=True`
+"""
+
+
+def _split_head(raw_input: str) -> tuple[str, str]:
+    # fast path for the common "name args..." form, str.isprintable() is False for any whitespace other than " "
+    head, _, tail = raw_input.partition(" ")
+    if head and head.isprintable():
+        return head, tail.lstrip()
+
+    # leading whitespace means an empty command name, as with the original regex-based split
+    if raw_input[:1].isspace():
+        return "", raw_input.lstrip()
+
+    parts = raw_input.split(None, 1)
+    return parts[0] if parts else "", parts[1] if len(parts) > 1 else ""
+
+
+def _lookup_alias(alias_index: dict[str, "Command"], name: str) -> Optional["Command"]:
+    # try the name as-is first (case-sensitive commands) then its lowercase form
+    cmd = alias_index.get(name)
+    if cmd is None or not cmd.matches(name):
+        cmd = alias_index.get(name.lower())
+    if cmd is not None and cmd.matches(name):
+        return cmd
+    return None
+
+
+def _unindex_alias(alias_index: dict[str, "Command"], removed: "Command", candidates: Iterable["Command"]):
+    # aliases shared with another command are handed back to the first remaining candidate that has them
+    candidates = list(candidates)
+    for alias in removed._alias_set:
+        if alias_index.get(alias) is not removed:
+            continue
+        replacement = next((cmd for cmd in candidates if alias in cmd._alias_set), None)
+        if replacement is None:
+            del alias_index[alias]
+        else:
+            alias_index[alias] = replacement
+
 
 class Command:
     """
     Represents a registered command which contains various information about the command including its base function.
     """
+    __slots__ = ("command_like", "is_class", "__wrapped_command__", "name", "description", "args", "aliases",
+                 "_aliases", "lowercase", "case_sensitive", "_alias_set", "__subcommands__", "_sub_alias_index",
+                 "_parent", "_command_like_instance", "_arg_matcher", "_invoker", "cacheable", "_result_cache",
+                 "_result_hits")
+
     def __init__(self, name: str, command_like: CommandLike,
                  /, aliases: list[str] = None, lowercase: bool = True, case_sensitive: bool = False,
-                 args: list["Arg"] = None):
+                 args: list["Arg"] = None, cacheable: bool = False):
 
         self.command_like = command_like
         """
@@ -27,11 +74,19 @@ class Command:
             self.is_class = inspect.isclass(command_like)
             self.__wrapped_command__ = False
 
+        # resolved once so that execution doesn't need to branch on the kind of command-like
+        self._invoker: Callable = command_like.__execute__ if self.is_class else command_like
+
         self.name: str = name
         """
         The name of the command
         """
-        self.description: str = getattr(command_like, "__description__", None)
+        try:
+            description = command_like.__description__
+        except AttributeError:
+            description = None
+
+        self.description: str = description
         """
         An (optional) description of the command
         """
@@ -41,46 +96,85 @@ class Command:
         """
 
         self.aliases = aliases
-        self._aliases = list(aliases)
-        self._aliases.insert(0, self.name)
+        self._aliases = [sys.intern(alias) for alias in ([name, *aliases] if aliases else [name])]
 
         self.lowercase = lowercase
         self.case_sensitive = case_sensitive
 
-        self.__subcommands__: set[Command] = set()
+        # normalized once here so that matching is a single hashed lookup
+        self._alias_set: frozenset[str] = frozenset(sys.intern(alias.lower()) if lowercase else alias for alias in self._aliases)
+
+        # insertion-ordered so that the newest subcommand wins shared aliases, both when added and removed
+        self.__subcommands__: dict[Command, None] = dict()
+        self._sub_alias_index: dict[str, Command] = dict()
         self._parent = None
 
         self._command_like_instance = None
 
         self._arg_matcher = ArgMatcher(self)
 
+        self.cacheable = cacheable
+        """
+        If results of this command should be reused when it is executed again with the same input
+        """
+        self._result_cache: Optional[dict[str, Any]] = dict() if cacheable else None
+        self._result_hits: Optional[dict[str, int]] = dict() if cacheable else None
+
     def execute(self, raw_input: str):
         """
         Executes the command (and therefore the execution function) with the provided raw input
         :param raw_input: The input string containing arguments for execution
         """
-        space = re.search(r"\s+", raw_input)
-        if space:
-            subcommand_name = raw_input[:space.start()]
-            sub_raw_input = raw_input[space.end():]
+        subcommand_name, sub_raw_input = _split_head(raw_input)
+        # a subcommand is only looked up when followed by whitespace, a lone token is input for this command
+        if subcommand_name != raw_input:
+            subcommand = _lookup_alias(self._sub_alias_index, subcommand_name)
+            if subcommand:
+                return subcommand.execute(sub_raw_input)
 
-            for subcommand in self.__subcommands__:
-                if subcommand.matches(subcommand_name):
-                    return subcommand.execute(sub_raw_input)
+        if self.cacheable:
+            if raw_input in self._result_cache:
+                self._result_hits[raw_input] += 1
+                return self._result_cache[raw_input]
 
-        args = self._arg_matcher.match_arguments(raw_input)
-        if self.is_class:
-            return self.command_like.__execute__(*args)
-        else:
-            return self.command_like(*args)
+            result = self._invoker(*self._arg_matcher.match_arguments(raw_input))
+            if len(self._result_cache) >= RESULT_CACHE_SIZE:
+                # evict the least frequently used input, ties go to the oldest entry
+                evicted = min(self._result_hits, key=self._result_hits.__getitem__)
+                del self._result_cache[evicted]
+                del self._result_hits[evicted]
+            self._result_cache[raw_input] = result
+            self._result_hits[raw_input] = 1
+            return result
+
+        return self._invoker(*self._arg_matcher.match_arguments(raw_input))
+
+    def clear_cache(self):
+        """
+        Clears any results cached for this command (see `cacheable`)
+        """
+        if self.cacheable:
+            self._result_cache.clear()
+            self._result_hits.clear()
 
     def add_subcommand(self, subcommand: "Command"):
         """
         Adds a subcommand to this command
         :param subcommand: The command to add
         """
-        self.__subcommands__.add(subcommand)
-        subcommand.__parent__ = self
+        self.__subcommands__[subcommand] = None
+        for alias in subcommand._alias_set:
+            self._sub_alias_index[alias] = subcommand
+        subcommand._parent = self
+
+    def remove_subcommand(self, subcommand: "Command"):
+        """
+        Removes a subcommand from this command
+        :param subcommand: The command to remove
+        """
+        self.__subcommands__.pop(subcommand, None)
+        _unindex_alias(self._sub_alias_index, subcommand, reversed(self.__subcommands__))
+        subcommand._parent = None
 
     def find_subcommand(self, parent: Union[str, CommandLike]) -> "Command":
         """
@@ -88,12 +182,20 @@ class Command:
         :param parent:
         :return:
         """
-        for subcommand in self.__subcommands__:
-            if isinstance(parent, str) and subcommand.matches(parent):
+        if isinstance(parent, str):
+            subcommand = _lookup_alias(self._sub_alias_index, parent)
+            if subcommand:
                 return subcommand
-            elif subcommand.command_like is parent:
+
+        for subcommand in self.__subcommands__:
+            if subcommand.command_like is parent:
                 return subcommand
-            return subcommand.find_subcommand(parent)
+
+        # only descend once every direct child has been checked
+        for subcommand in self.__subcommands__:
+            found = subcommand.find_subcommand(parent)
+            if found:
+                return found
         return None
 
     def get_instance(self):
@@ -118,14 +220,9 @@ class Command:
         :param cmd_name: The name to check for matches
         :return: `True` if this command matches the given name otherwise `False`.
         """
-        for alias in self._aliases:
-            if self.lowercase:
-                alias = alias.lower()
-            if self.case_sensitive and cmd_name == alias:
-                return True
-            if cmd_name.lower() == alias:
-                return True
-        return False
+        if self.case_sensitive and cmd_name in self._alias_set:
+            return True
+        return cmd_name.lower() in self._alias_set
 
 
 
@@ -134,8 +231,10 @@ class CLI:
         """
         :param console_input: A function which probes for user input (default: input())
         """
-        self._commands: set[Command] = set()
+        # insertion-ordered so that lookups falling back to a scan are deterministic
+        self._commands: dict[Command, None] = dict()
         self._command_table: dict[CommandLike, Command] = dict()
+        self._alias_index: dict[str, Command] = dict()
         self.console_input = console_input
         self._processed = False
         self.result = None
@@ -144,7 +243,7 @@ class CLI:
     @__complex_decorator__(no_wrap=False)
     def command(self, command_like,
                 aliases: list[str] = None, name: str = None, lowercase: bool = True, case_sensitive: bool = True,
-                args: list["Arg"] = None):
+                args: list["Arg"] = None, cacheable: bool = False):
         """
         A decorator that registers a command-like object as a command, allowing it to be executed when matched in
         an input string.
@@ -214,14 +313,16 @@ class CLI:
         :param lowercase: If the command name should be lowercase (defaults to True)
         :param case_sensitive: If the command name is case-sensitive (defaults to True)
         :param args: A list of :class:`Arg` to be used as an alternative to signature-based declarations
+        :param cacheable: If results should be reused for repeated inputs, only use this for commands without side
+            effects (defaults to False)
         :return: The wrapped function
         """
-        return self._register_command(command_like, None, aliases, name, lowercase, case_sensitive, args)
+        return self._register_command(command_like, None, aliases, name, lowercase, case_sensitive, args, cacheable)
 
     @__complex_decorator__(no_wrap=True)
     def subcommand(self, command_like, parent: type = None,
                    aliases: list[str] = None, name: str = None, lowercase: bool = True, case_sensitive: bool = True,
-                   args: list[Arg] = None):
+                   args: list[Arg] = None, cacheable: bool = False):
         """
         A decorator that registers a command-like object as a command, allowing it to be executed when matched in
         an input string.
@@ -258,11 +359,13 @@ class CLI:
         :param lowercase: If the command name should be lowercase (defaults to True).
         :param case_sensitive: If the command name is case-sensitive (defaults to True).
         :param args: A list of :class:`Arg` to be used as an alternative to signature-based declarations.
+        :param cacheable: If results should be reused for repeated inputs, only use this for commands without side
+            effects (defaults to False).
         :return: The wrapped function
         """
         if parent is None:
             raise ValueError("parent cannot be None")
-        return self._register_command(command_like, parent, aliases, name, lowercase, case_sensitive, args)
+        return self._register_command(command_like, parent, aliases, name, lowercase, case_sensitive, args, cacheable)
 
     def identity(self, func):
         """
@@ -270,10 +373,15 @@ class CLI:
         :param func: The function to modify
         :return: A modified function that returns a :class:`Command` instance.
         """
-        parent_class = func.__qualname__.split(".")[-2]
+        parent_class = func.__qualname__.rsplit(".", 2)[-2]
+        command = None
 
         def wrapper(*_):
-            return self.find_command(parent_class)
+            nonlocal command
+            # the parent may not be registered yet when decorated, so resolve on first call and reuse afterwards
+            if command is None:
+                command = self.find_command(parent_class)
+            return command
 
         return wrapper
 
@@ -283,6 +391,11 @@ class CLI:
         :param identifier: The name/alias of a command or a command-like object.
         :return: The first matching command or `None` if no suitable command is found.
         """
+        if isinstance(identifier, str):
+            command = _lookup_alias(self._alias_index, identifier)
+            if command:
+                return command
+
         for command in self._commands:
             if isinstance(identifier, str) and command.matches(identifier):
                 return command
@@ -319,20 +432,13 @@ class CLI:
         """
         self._processed = False
 
-        space = re.search(r"\s+", raw_input)
-        if not space:
-            command_name = raw_input
-            raw_input = ""
-        else:
-            command_name = raw_input[:space.start()]
-            raw_input = raw_input[space.end():]
+        command_name, raw_input = _split_head(raw_input)
 
-        commands = list(self._commands)
-        for cmd in commands:
-            if cmd.matches(command_name):
-                self.result = cmd.execute(raw_input)
-                self._processed = True
-                return self.result
+        cmd = _lookup_alias(self._alias_index, command_name)
+        if cmd:
+            self.result = cmd.execute(raw_input)
+            self._processed = True
+            return self.result
 
     def unregister(self, command_like: CommandLike):
         """
@@ -342,26 +448,28 @@ class CLI:
         """
         matched = [cmd for cmd in self._commands if cmd.command_like == command_like]
         for match in matched:
-            self._commands.remove(match)
+            del self._commands[match]
+            # the most recently registered command takes precedence, matching registration order
+            _unindex_alias(self._alias_index, match, reversed(self._commands))
         table_entry = self._command_table.get(command_like)
         if table_entry:
             parent = table_entry.get_parent()
             if parent:
-                parent.__subcommands__.remove(table_entry)
+                parent.remove_subcommand(table_entry)
 
     def __iter__(self):
         return self._commands.__iter__()
 
     def _register_command(self, command_like, parent: type = None,
                           aliases: list[str] = None, name: str = None, lowercase: bool = False, case_sensitive: bool = True,
-                          args: list["Arg"] = None):
+                          args: list["Arg"] = None, cacheable: bool = False):
 
         cmd_name: str = name if name else command_like.__name__
 
         aliases = [] if aliases is None else list(aliases)
 
         cmd = Command(cmd_name, command_like, aliases=aliases, lowercase=lowercase,
-                      case_sensitive=case_sensitive, args=args)
+                      case_sensitive=case_sensitive, args=args, cacheable=cacheable)
 
         self._command_table[command_like] = cmd
         command_like.__boundcommand__ = cmd
@@ -374,5 +482,7 @@ class CLI:
             else:
                 raise ValueError(f"Parent not found {parent}")
 
-        self._commands.add(cmd)
+        self._commands[cmd] = None
+        for alias in cmd._alias_set:
+            self._alias_index[alias] = cmd
         return command_like
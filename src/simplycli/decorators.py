@@ -1,3 +1,5 @@
+import types
+
 _type = type
 
 
@@ -14,33 +16,55 @@ def __annotated__(decorator):
     return annotated_inner
 
 
-def __complex_decorator__(**decorator_flags):
-    def inner(outer, *_, **__):
-        def real_decorator(cli, *args, **kwargs):
-            executed = None
-            args = list(args)
-
-            if len(args) != 0:
-                executed = args[0]
-                args = args[1:]
+class _CommandDecorator:
+    """
+    Bound in place of a decorated method, splitting calls into the executed object (if any) and decorator arguments.
+    """
+    __slots__ = ("outer", "no_wrap")
+
+    def __init__(self, outer, no_wrap):
+        self.outer = outer
+        self.no_wrap = no_wrap
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return types.MethodType(self, instance)
+
+    def __call__(self, cli, *args, **kwargs):
+        executed = None
+        if len(args) != 0:
+            executed = args[0]
+            args = args[1:]
+
+        wrapper = _CommandDecoratorWrapper(self, cli, executed, args, kwargs)
+        if executed and self.no_wrap is False:
+            return wrapper(executed)
+        return wrapper
 
-            args.insert(0, cli)
 
-            def wrapper(f, *_, **__):
-                run_args = list(args)
+class _CommandDecoratorWrapper:
+    """
+    Holds the arguments of a :class:`_CommandDecorator` call until the decorated object is received.
+    """
+    __slots__ = ("ctx", "cli", "executed", "args", "kwargs")
 
-                run_args.insert(1, f)
-                if decorator_flags.get("no_wrap") and executed:
-                    run_args.insert(2, executed)
+    def __init__(self, ctx: _CommandDecorator, cli, executed, args: tuple, kwargs: dict):
+        self.ctx = ctx
+        self.cli = cli
+        self.executed = executed
+        self.args = args
+        self.kwargs = kwargs
 
-                res = outer(*run_args, **kwargs)
-                return res
+    def __call__(self, f, *_, **__):
+        if self.ctx.no_wrap and self.executed:
+            return self.ctx.outer(self.cli, f, self.executed, *self.args, **self.kwargs)
+        return self.ctx.outer(self.cli, f, *self.args, **self.kwargs)
 
-            if executed and decorator_flags.get("no_wrap") is False:
-                return wrapper(executed)
-            return wrapper
 
-        return real_decorator
+def __complex_decorator__(**decorator_flags):
+    def inner(outer, *_, **__):
+        return _CommandDecorator(outer, decorator_flags.get("no_wrap"))
 
     return inner
 
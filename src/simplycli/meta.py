@@ -23,6 +23,7 @@ class AbstractFunctionCommandWrapper(abc.ABC):
     A niche class that must be used on function wrapper classes, or more specifically, classes that can be invoked
     via teh __call__ method.
     """
+    __slots__ = ()
 
     @abc.abstractmethod
     def signature(self) -> CommandLike:
@@ -42,10 +43,16 @@ class AbstractFunctionCommandWrapper(abc.ABC):
         """
         raise NotImplementedError
 
-    def __getattribute__(self, item):
+    def __getattr__(self, item):
+        # only reached when normal lookup fails, the resolved name is then cached on the instance
         if item == "__name__":
-            return self.signature().__name__
-        return super().__getattribute__(item)
+            name = self.signature().__name__
+            try:
+                object.__setattr__(self, "__name__", name)
+            except AttributeError:  # subclass declares __slots__ without __dict__, so the name can't be cached
+                pass
+            return name
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{item}'")
 
     def __call__(self, *args, **kwargs):
         return self.invoke(*args, **kwargs)
@@ -31,6 +31,12 @@ class MyTestCase(unittest.TestCase):
 
         result = self.cli.process_input("one")
         self.assertEqual(1, result)
+        self.assertEqual(3, self.cli.process_input("subtract 5 2"))
+
+        self.cli.bundles.remove(bundle)
+        self.assertIsNone(self.cli.process_input("one"))
+        self.assertIsNone(self.cli.process_input("subtract 5 2"))
+        self.assertFalse(self.cli.was_processed())
 
 
 if __name__ == '__main__':
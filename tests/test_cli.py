@@ -1,6 +1,6 @@
 import unittest
 
-from simplycli import CLI
+from simplycli import CLI, Arg, Command
 
 
 class CLITestCase(unittest.TestCase):
@@ -30,6 +30,143 @@ class CLITestCase(unittest.TestCase):
         self.cli.process_input("aaaa")
         self.assertFalse(self.cli.was_processed())
 
+        self.cli.process_input(" test")
+        self.assertFalse(self.cli.was_processed())
+        self.cli.process_input("\ttest arg")
+        self.assertFalse(self.cli.was_processed())
+
+    def test_unregister_shared_alias(self):
+        @self.cli.command
+        def foo():
+            return "A"
+
+        @self.cli.command(name="foo")
+        def foo2():
+            return "B"
+
+        self.assertEqual("B", self.cli.process_input("foo"))
+
+        self.cli.unregister(foo2)
+        self.assertEqual("A", self.cli.process_input("foo"))
+        self.assertTrue(self.cli.was_processed())
+        self.assertIs(foo, self.cli.find_command("foo").command_like)
+
+        self.cli.unregister(foo)
+        self.assertIsNone(self.cli.process_input("foo"))
+        self.assertFalse(self.cli.was_processed())
+
+    def test_command_without_aliases(self):
+        cmd = Command("ping", lambda: "pong")
+        self.assertTrue(cmd.matches("ping"))
+        self.assertEqual("pong", cmd.execute(""))
+
+    def test_identity(self):
+        @self.cli.command
+        class Identified:
+            @self.cli.identity
+            def command(self):
+                pass
+
+            def __execute__(self):
+                return self.command()
+
+        cmd = self.cli.process_input("identified")
+        self.assertEqual("Identified", cmd.name)
+        self.assertIs(cmd, self.cli.process_input("identified"))
+
+    def test_cacheable_command(self):
+        calls = []
+
+        @self.cli.command(cacheable=True)
+        def square(value: int = Arg(0)):
+            calls.append(value)
+            return value * value
+
+        self.assertEqual(9, self.cli.process_input("square 3"))
+        self.assertEqual(9, self.cli.process_input("square 3"))
+        self.assertEqual(16, self.cli.process_input("square 4"))
+        self.assertEqual([3, 4], calls)
+
+        self.cli.find_command("square").clear_cache()
+        self.assertEqual(9, self.cli.process_input("square 3"))
+        self.assertEqual([3, 4, 3], calls)
+
+    def test_subcommand_processing(self):
+        @self.cli.command
+        class Math:
+            @staticmethod
+            def __execute__():
+                return "math"
+
+        @self.cli.subcommand(Math)
+        def add(o1: int = Arg(0), o2: int = Arg(1)):
+            return o1 + o2
+
+        @self.cli.subcommand(Math)
+        def zero():
+            return 0
+
+        self.assertEqual("math", self.cli.process_input("math"))
+        self.assertEqual(9, self.cli.process_input("math add 5 4"))
+        self.assertEqual("math", self.cli.process_input("math zero"))
+        self.assertEqual(0, self.cli.process_input("math\tzero "))
+
+        @self.cli.subcommand(add)
+        def twice(o1: int = Arg(0)):
+            return o1 * 2
+
+        self.assertEqual(8, self.cli.process_input("math add twice 4"))
+        self.assertIs(twice, self.cli.find_command("twice").command_like)
+        self.assertEqual("add", self.cli.find_command("twice").get_parent().name)
+
+        self.cli.unregister(zero)
+        self.assertIsNone(self.cli.find_command("zero"))
+        self.assertEqual("math", self.cli.process_input("math zero "))
+
+    def test_remove_shared_subcommand_alias(self):
+        @self.cli.command
+        class Parent:
+            @staticmethod
+            def __execute__():
+                return "parent"
+
+        @self.cli.subcommand(Parent)
+        def child():
+            return "A"
+
+        @self.cli.subcommand(Parent, name="child")
+        def child2():
+            return "B"
+
+        self.assertEqual("B", self.cli.process_input("parent child "))
+
+        self.cli.unregister(child2)
+        self.assertEqual("A", self.cli.process_input("parent child "))
+
+        self.cli.unregister(child)
+        self.assertEqual("parent", self.cli.process_input("parent child "))
+
+    def test_remove_shared_subcommand_alias_restores_newest(self):
+        @self.cli.command
+        class Parent:
+            @staticmethod
+            def __execute__():
+                return "parent"
+
+        children = []
+        for result in "ABCDEFGH":
+            def child(result=result):
+                return result
+
+            self.cli.subcommand(Parent, name="child")(child)
+            children.append(child)
+
+        self.assertEqual("H", self.cli.process_input("parent child "))
+
+        for removed, expected in zip(reversed(children), "GFEDCBA"):
+            self.cli.unregister(removed)
+            self.assertEqual(expected, self.cli.process_input("parent child "))
+
 
 
 